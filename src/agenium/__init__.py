@@ -7,8 +7,9 @@ Usage:
 
 __version__ = "0.1.0"
 
-from .agent import Agent, AgentConfig, ConnectResult, DNSRegistrationResult
-from .dns import DNSResolver, ResolvedAgent, AgentTool
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .protocol import (
     MessageType,
     RequestFrame,
@@ -30,6 +31,36 @@ from .core import (
     to_agent_uri,
 )
 
+if TYPE_CHECKING:
+    from .agent import Agent, AgentConfig, ConnectResult, DNSRegistrationResult
+    from .dns import DNSResolver, ResolvedAgent, AgentTool
+
+# Names whose modules pull in httpx/cryptography; imported on first access
+# so `import agenium` and the validate/status CLI commands stay fast.
+_LAZY = {
+    "Agent": ".agent",
+    "AgentConfig": ".agent",
+    "ConnectResult": ".agent",
+    "DNSRegistrationResult": ".agent",
+    "DNSResolver": ".dns",
+    "ResolvedAgent": ".dns",
+    "AgentTool": ".dns",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
 __all__ = [
     # Agent
     "Agent",
@@ -8,14 +8,23 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Awaitable, Callable, Optional
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Mapping, Optional
 
 import httpx
+import msgspec
 
 from .core.types import AgentID, Session, SessionState, generate_id, validate_agent_name
 from .crypto.keys import KeyPair, generate_keypair
-from .dns.resolver import DNSResolver, ResolvedAgent
+from .dns.resolver import (
+    REGISTER_ENCODER,
+    DNSResolver,
+    RegisterRequest,
+    RegisterTool,
+    ResolvedAgent,
+)
 from .protocol.types import (
     EventFrame,
     RequestFrame,
@@ -30,7 +39,7 @@ DEFAULT_DNS_SERVER = "185.204.169.26"
 DEFAULT_DNS_PORT = 3000
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     """Configuration for an Agent."""
 
@@ -42,7 +51,7 @@ class AgentConfig:
     persistence: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectResult:
     """Result of connecting to another agent."""
 
@@ -51,7 +60,7 @@ class ConnectResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DNSRegistrationResult:
     """Result of DNS registration."""
 
@@ -76,6 +85,24 @@ class Agent:
         await agent.register(api_key="dom_xxx")
     """
 
+    __slots__ = (
+        "_name",
+        "_config",
+        "_keys",
+        "_identity",
+        "_tool_registry",
+        "_resolver",
+        "_sessions",
+        "_dns_api_key",
+        "_dns_client",
+        "_tools_payload",
+        "_tools_payload_version",
+        "_is_running",
+        "_request_handlers",
+        "_event_handlers",
+        "__weakref__",
+    )
+
     def __init__(self, name: str, config: AgentConfig | None = None):
         if not validate_agent_name(name):
             raise ValueError(
@@ -98,6 +125,9 @@ class Agent:
         )
         self._sessions: dict[str, Session] = {}
         self._dns_api_key: str | None = None
+        self._dns_client: httpx.AsyncClient | None = None
+        self._tools_payload = msgspec.Raw(b"[]")
+        self._tools_payload_version = -1
         self._is_running = False
         self._request_handlers: dict[str, Callable] = {}
         self._event_handlers: dict[str, Callable] = {}
@@ -132,12 +162,12 @@ class Agent:
         return self._is_running
 
     @property
-    def sessions(self) -> dict[str, Session]:
-        """Active sessions."""
-        return dict(self._sessions)
+    def sessions(self) -> Mapping[str, Session]:
+        """Active sessions (read-only live view)."""
+        return MappingProxyType(self._sessions)
 
     @property
-    def tools(self) -> list[ToolDefinition]:
+    def tools(self) -> tuple[ToolDefinition, ...]:
         """Registered tools."""
         return self._tool_registry.list_tools()
 
@@ -159,6 +189,8 @@ class Agent:
             @agent.tool("greet", description="Greet someone")
             async def greet(name: str) -> str:
                 return f"Hello, {name}!"
+
+        Plain (non-async) functions work too and are called directly.
         """
 
         def decorator(fn: ToolHandler) -> ToolHandler:
@@ -216,16 +248,21 @@ class Agent:
 
     async def stop(self) -> None:
         """Gracefully stop the agent."""
-        if not self._is_running:
-            return
+        if self._is_running:
+            # Close all sessions
+            closed = SessionState.CLOSED
+            for session in self._sessions.values():
+                session.state = closed
 
-        # Close all sessions
-        for session in self._sessions.values():
-            session.state = SessionState.CLOSED
+            self._sessions.clear()
+            self._is_running = False
+            logger.info("Agent %s stopped", self._name)
 
-        self._sessions.clear()
-        self._is_running = False
-        logger.info("Agent %s stopped", self._name)
+        # Release pooled DNS connections (also opened by register() before start())
+        await self._resolver.aclose()
+        if self._dns_client is not None:
+            await self._dns_client.aclose()
+            self._dns_client = None
 
     # ========================================================================
     # DNS Registration
@@ -245,48 +282,70 @@ class Agent:
         """
         self._dns_api_key = api_key
 
-        tools_payload = [
-            {
-                "name": t.name,
-                "description": t.description,
-                **({"inputSchema": t.input_schema} if t.input_schema else {}),
-            }
-            for t in self._tool_registry.list_tools()
-        ]
-
-        dns_url = (
-            f"http://{self._config.dns_server}:{self._config.dns_port}"
+        body = REGISTER_ENCODER.encode(
+            RegisterRequest(
+                name=self._name,
+                endpoint=host or "auto",
+                public_key=self._keys.public_key_b64,
+                tools=self._encoded_tools(),
+            )
         )
 
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                resp = await client.post(
-                    f"{dns_url}/dns/register",
-                    json={
-                        "name": self._name,
-                        "endpoint": host or "auto",
-                        "publicKey": self._keys.public_key_b64,
-                        "tools": tools_payload,
-                    },
-                    headers={"Authorization": f"Bearer {api_key}"},
-                )
+            client = self._get_dns_client()
+            resp = await client.post(
+                "/dns/register",
+                content=body,
+                headers={
+                    "Authorization": f"Bearer {api_key}",
+                    "Content-Type": "application/json",
+                },
+            )
 
-                if resp.status_code in (200, 201):
-                    data = resp.json()
-                    return DNSRegistrationResult(
-                        success=True,
-                        domain=f"agent://{self._name}",
-                        tools=len(tools_payload),
-                    )
-                else:
-                    return DNSRegistrationResult(
-                        success=False,
-                        error=f"Registration failed: {resp.status_code} {resp.text}",
-                    )
+            if resp.status_code in (200, 201):
+                return DNSRegistrationResult(
+                    success=True,
+                    domain=f"agent://{self._name}",
+                    tools=len(self._tool_registry),
+                )
+            else:
+                return DNSRegistrationResult(
+                    success=False,
+                    error=f"Registration failed: {resp.status_code} {resp.text}",
+                )
 
         except Exception as e:
             return DNSRegistrationResult(success=False, error=str(e))
 
+    def _encoded_tools(self) -> msgspec.Raw:
+        """Tools list as registration JSON, re-encoded only when tools change."""
+        registry = self._tool_registry
+        if self._tools_payload_version != registry.version:
+            self._tools_payload = msgspec.Raw(
+                REGISTER_ENCODER.encode(
+                    [
+                        RegisterTool(
+                            name=t.name,
+                            description=t.description,
+                            input_schema=t.input_schema or None,
+                        )
+                        for t in registry.list_tools()
+                    ]
+                )
+            )
+            self._tools_payload_version = registry.version
+        return self._tools_payload
+
+    def _get_dns_client(self) -> httpx.AsyncClient:
+        """Return the shared DNS registration client, creating it on first use."""
+        if self._dns_client is None:
+            self._dns_client = httpx.AsyncClient(
+                base_url=f"http://{self._config.dns_server}:{self._config.dns_port}",
+                timeout=10,
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60),
+            )
+        return self._dns_client
+
     # ========================================================================
     # Connection
     # ========================================================================
@@ -383,11 +442,12 @@ class Agent:
 
     def on_request(self, method: str, handler: Callable) -> None:
         """Register a handler for incoming requests."""
-        self._request_handlers[method] = handler
+        # Interned so dispatch on an interned wire method compares by identity
+        self._request_handlers[sys.intern(method)] = handler
 
     def on_event(self, event: str, handler: Callable) -> None:
         """Register a handler for incoming events."""
-        self._event_handlers[event] = handler
+        self._event_handlers[sys.intern(event)] = handler
 
     # ========================================================================
     # Repr
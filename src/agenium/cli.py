@@ -13,7 +13,6 @@ import sys
 
 from . import __version__
 from .core.types import parse_agent_uri, validate_agent_name
-from .dns.resolver import DNSResolver
 
 
 def main() -> None:
@@ -51,6 +50,9 @@ def main() -> None:
 
 
 async def _resolve(args: argparse.Namespace) -> None:
+    # Imported here so validate/status don't load httpx
+    from .dns.resolver import DNSResolver
+
     resolver = DNSResolver(server=args.server, port=args.port)
     try:
         agent = await resolver.resolve(args.name)
@@ -66,6 +68,8 @@ async def _resolve(args: argparse.Namespace) -> None:
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        await resolver.aclose()
 
 
 def _validate(args: argparse.Namespace) -> None:
@@ -6,11 +6,13 @@ Fundamental data structures for agent-to-agent communication.
 
 from __future__ import annotations
 
+import os
 import re
+import string
 import time
-import uuid
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Optional
 
 
@@ -19,9 +21,9 @@ from typing import Any, Optional
 # ============================================================================
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentID:
-    """Unique identifier for an agent in the network."""
+    """Unique identifier for an agent in the network. Immutable and hashable."""
 
     name: str
     """Unique name (used in agent:// URI)."""
@@ -33,7 +35,7 @@ class AgentID:
     """Optional human-readable description."""
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentToolRef:
     """A tool/function that an agent exposes."""
 
@@ -41,7 +43,7 @@ class AgentToolRef:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentEndpoint:
     """Resolved endpoint for connecting to an agent."""
 
@@ -61,7 +63,12 @@ class AgentEndpoint:
 
 
 class SessionState(str, Enum):
-    """Session lifecycle states."""
+    """
+    Session lifecycle states.
+
+    Members are singletons; compare with ``is`` (``state is SessionState.ACTIVE``),
+    which is a pointer check rather than a string comparison.
+    """
 
     INITIATING = "initiating"
     HANDSHAKE = "handshake"
@@ -73,7 +80,7 @@ class SessionState(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """An active session between two agents."""
 
@@ -90,7 +97,16 @@ class Session:
 # URI Parsing
 # ============================================================================
 
-_AGENT_NAME_RE = re.compile(r"^[a-z0-9\u0080-\uffff]([a-z0-9\u0080-\uffff-]*[a-z0-9\u0080-\uffff])?$")
+_AGENT_NAME_RE = re.compile(r"[a-z0-9\u0080-\uffff]([a-z0-9\u0080-\uffff-]*[a-z0-9\u0080-\uffff])?")
+_match_agent_name = _AGENT_NAME_RE.fullmatch
+
+# ASCII bytes allowed in a name, either case (names are lowercased on output).
+_ASCII_NAME_BYTES = (string.ascii_letters + string.digits + "-").encode("ascii")
+
+# The names an agent routes between are few and recur on every frame, so
+# name checks are memoized. Only names within the length limit reach the
+# cache, which bounds it to _NAME_CACHE_SIZE keys of at most 50 characters.
+_NAME_CACHE_SIZE = 4096
 
 
 def parse_agent_uri(uri: str) -> Optional[str]:
@@ -111,21 +127,10 @@ def parse_agent_uri(uri: str) -> Optional[str]:
     >>> parse_agent_uri("invalid") is None
     True
     """
-    if not uri.startswith("agent://"):
-        return None
-
-    name = uri[8:].lower()
-
-    if len(name) < 2 or len(name) > 50:
-        return None
-
-    if name.startswith("-") or name.endswith("-"):
-        return None
-
-    if not _AGENT_NAME_RE.match(name):
+    name = uri.removeprefix("agent://")
+    if len(name) == len(uri) or len(name) < 2 or len(name) > 50:
         return None
-
-    return name
+    return _normalize_agent_name(name)
 
 
 def is_valid_agent_uri(uri: str) -> bool:
@@ -144,16 +149,31 @@ def validate_agent_name(name: str) -> bool:
     """
     if len(name) < 2 or len(name) > 50:
         return False
-    if name.startswith("-") or name.endswith("-"):
-        return False
-    return bool(_AGENT_NAME_RE.match(name.lower()))
+    return _normalize_agent_name(name) is not None
+
+
+@lru_cache(maxsize=_NAME_CACHE_SIZE)
+def _normalize_agent_name(name: str) -> Optional[str]:
+    """Lowercased name if valid, else None. Callers check the length first."""
+    if name[0] == "-" or name[-1] == "-":
+        return None
+    if name.isascii():
+        # Deleting every allowed byte leaves nothing only if all bytes are allowed
+        if name.encode("ascii").translate(None, _ASCII_NAME_BYTES):
+            return None
+        return name.lower()
+    lowered = name.lower()
+    return lowered if _match_agent_name(lowered) is not None else None
 
 
 def to_agent_uri(name: str) -> str:
     """Convert a name to agent:// URI format."""
-    return f"agent://{name.lower()}"
+    return "agent://" + name.lower()
+
+
+_urandom = os.urandom
 
 
 def generate_id() -> str:
-    """Generate a unique ID."""
-    return str(uuid.uuid4())
+    """Generate a unique ID (32 hex chars, 128 random bits)."""
+    return _urandom(16).hex()
@@ -7,7 +7,8 @@ Uses Ed25519 for agent identity keys.
 from __future__ import annotations
 
 import base64
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
 
 from cryptography.hazmat.primitives.asymmetric.ed25519 import (
     Ed25519PrivateKey,
@@ -21,13 +22,15 @@ from cryptography.hazmat.primitives.serialization import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyPair:
     """Ed25519 key pair."""
 
     private_key: Ed25519PrivateKey
     public_key: Ed25519PublicKey
     public_key_b64: str
+    _private_pem: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _public_pem: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def sign(self, data: bytes) -> bytes:
         """Sign data with the private key."""
@@ -42,16 +45,20 @@ class KeyPair:
             return False
 
     def private_key_pem(self) -> str:
-        """Export private key as PEM."""
-        return self.private_key.private_bytes(
-            Encoding.PEM, PrivateFormat.PKCS8, NoEncryption()
-        ).decode()
+        """Export private key as PEM (computed once, then cached)."""
+        if self._private_pem is None:
+            self._private_pem = self.private_key.private_bytes(
+                Encoding.PEM, PrivateFormat.PKCS8, NoEncryption()
+            ).decode()
+        return self._private_pem
 
     def public_key_pem(self) -> str:
-        """Export public key as PEM."""
-        return self.public_key.public_bytes(
-            Encoding.PEM, PublicFormat.SubjectPublicKeyInfo
-        ).decode()
+        """Export public key as PEM (computed once, then cached)."""
+        if self._public_pem is None:
+            self._public_pem = self.public_key.public_bytes(
+                Encoding.PEM, PublicFormat.SubjectPublicKeyInfo
+            ).decode()
+        return self._public_pem
 
 
 def generate_keypair() -> KeyPair:
@@ -0,0 +1,155 @@
+"""
+Minimal HTTP/1.1 Client
+
+A single keep-alive connection for small GET requests against the DNS
+server, skipping httpx's per-request URL, header and event-hook machinery.
+Plain HTTP only; HTTPS lookups always go through httpx.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from urllib.parse import quote
+
+
+class HTTPProtocolError(Exception):
+    """The response can't be handled by this client; retry with a full one."""
+
+
+@dataclass(slots=True)
+class RawResponse:
+    """A fully read HTTP response. Header names are lowercased."""
+
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+
+
+class RawHTTPConnection:
+    """
+    One persistent HTTP/1.1 connection, used by one request at a time.
+
+    Usage:
+        conn = RawHTTPConnection("185.204.169.26", 3000, timeout=10)
+        resp = await conn.get("/dns/lookup/my-agent", {"Accept": "application/json"})
+        await conn.aclose()
+    """
+
+    def __init__(self, host: str, port: int, timeout: float, host_header: str | None = None):
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._host_header = host_header or f"{host}:{port}"
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
+
+    async def get(self, path: str, headers: dict[str, str]) -> RawResponse:
+        """
+        Send a GET request and read the whole response.
+
+        Raises:
+            HTTPProtocolError if the response is malformed or unsupported
+            asyncio.TimeoutError if the request takes longer than the timeout
+            OSError / asyncio.IncompleteReadError on connection failure
+        """
+        lines = [
+            f"GET {quote(path, safe='/')} HTTP/1.1",
+            f"Host: {self._host_header}",
+            "Connection: keep-alive",
+        ]
+        lines.extend(f"{k}: {v}" for k, v in headers.items())
+        request = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+        async with self._lock:
+            # A kept-alive connection may have been closed by the server since
+            # its last use; in that case retry once on a fresh connection.
+            retry = self._writer is not None
+            while True:
+                try:
+                    return await asyncio.wait_for(self._roundtrip(request), self._timeout)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    await self._close()
+                    if not retry:
+                        raise
+                    retry = False
+                except BaseException:
+                    await self._close()
+                    raise
+
+    async def _roundtrip(self, request: bytes) -> RawResponse:
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self._host, self._port)
+        reader = self._reader
+        assert reader is not None
+        self._writer.write(request)
+        await self._writer.drain()
+
+        try:
+            version, status, headers = await self._read_head(reader)
+            # Interim responses (100 Continue, 103 Early Hints) carry headers
+            # only; skip them so the final response isn't left on the socket.
+            while 100 <= status < 200:
+                if status == 101:
+                    raise HTTPProtocolError("Unexpected protocol switch")
+                version, status, headers = await self._read_head(reader)
+
+            if status in (204, 304):
+                content = b""
+            elif headers.get("transfer-encoding", "").lower() == "chunked":
+                content = await self._read_chunked(reader)
+            elif "content-length" in headers:
+                content = await reader.readexactly(int(headers["content-length"]))
+            else:
+                raise HTTPProtocolError("Response body is not length-delimited")
+        except (ValueError, asyncio.LimitOverrunError) as e:
+            raise HTTPProtocolError(f"Malformed response: {e}") from e
+
+        connection = headers.get("connection", "").lower()
+        if connection == "close" or (version == b"HTTP/1.0" and connection != "keep-alive"):
+            await self._close()
+        return RawResponse(status_code=status, headers=headers, content=content)
+
+    @staticmethod
+    async def _read_head(reader: asyncio.StreamReader) -> tuple[bytes, int, dict[str, str]]:
+        """Read a status line and headers; returns (version, status, headers)."""
+        version, _, rest = (await reader.readuntil(b"\r\n")).partition(b" ")
+        status = int(rest[:3])
+        headers: dict[str, str] = {}
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                return version, status, headers
+            name, sep, value = line.partition(b":")
+            if not sep:
+                raise HTTPProtocolError(f"Malformed header line: {line!r}")
+            headers[name.strip().lower().decode("latin-1")] = value.strip().decode("latin-1")
+
+    @staticmethod
+    async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+        body = bytearray()
+        while True:
+            size_line = await reader.readuntil(b"\r\n")
+            size = int(size_line.split(b";", 1)[0], 16)
+            if size == 0:
+                # Skip trailers up to the terminating blank line
+                while await reader.readuntil(b"\r\n") != b"\r\n":
+                    pass
+                return bytes(body)
+            body += await reader.readexactly(size)
+            await reader.readexactly(2)
+
+    async def _close(self) -> None:
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def aclose(self) -> None:
+        """Close the connection."""
+        async with self._lock:
+            await self._close()
@@ -6,14 +6,21 @@ Resolves agent:// URIs to endpoints via the AGENIUM DNS system.
 
 from __future__ import annotations
 
+import asyncio
+import ipaddress
+import itertools
+import socket
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Optional, Union
 
 import httpx
+import msgspec
 
 from ..core.types import parse_agent_uri, validate_agent_name
+from .http11 import HTTPProtocolError, RawHTTPConnection, RawResponse
 
 
 # ============================================================================
@@ -21,7 +28,7 @@ from ..core.types import parse_agent_uri, validate_agent_name
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentTool:
     """A tool advertised by an agent in DNS."""
 
@@ -31,7 +38,7 @@ class AgentTool:
     output_schema: Optional[dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedAgent:
     """Result of resolving an agent name via DNS."""
 
@@ -62,15 +69,132 @@ class DNSError(Exception):
 
     def __init__(self, code: DNSErrorCode, message: str):
         self.code = code
+        self.message = message
         super().__init__(f"[{code.value}] {message}")
 
 
+# ============================================================================
+# Wire Format
+# ============================================================================
+
+
+# Records are decoded leniently: servers may send snake_case keys instead of
+# camelCase ones, nulls for optional fields and float TTLs. The *_snake fields
+# hold the alternate spelling; read the accessors below rather than the raw
+# fields.
+
+
+class AgentToolRecord(msgspec.Struct):
+    """A tool entry as returned by the DNS server."""
+
+    name: str = ""
+    description: Optional[str] = ""
+    input_schema_camel: Optional[dict[str, Any]] = msgspec.field(default=None, name="inputSchema")
+    output_schema_camel: Optional[dict[str, Any]] = msgspec.field(default=None, name="outputSchema")
+    input_schema_snake: Optional[dict[str, Any]] = msgspec.field(default=None, name="input_schema")
+    output_schema_snake: Optional[dict[str, Any]] = msgspec.field(
+        default=None, name="output_schema"
+    )
+
+    @property
+    def input_schema(self) -> Optional[dict[str, Any]]:
+        return self.input_schema_camel or self.input_schema_snake
+
+    @property
+    def output_schema(self) -> Optional[dict[str, Any]]:
+        return self.output_schema_camel or self.output_schema_snake
+
+
+class AgentRecord(msgspec.Struct):
+    """An agent record as returned by ``/dns/lookup``."""
+
+    name: str = ""
+    endpoint: str = ""
+    public_key_camel: Optional[str] = msgspec.field(default=None, name="publicKey")
+    public_key_snake: Optional[str] = msgspec.field(default=None, name="public_key")
+    tools: Optional[list[AgentToolRecord]] = None
+    capabilities: Optional[list[str]] = None
+    ttl: Optional[Union[int, float]] = None
+    metadata: Optional[dict[str, Any]] = None
+
+    @property
+    def public_key(self) -> str:
+        # publicKey wins whenever it is present, as with the old dict parser
+        if self.public_key_camel is not None:
+            return self.public_key_camel
+        return self.public_key_snake or ""
+
+
+class LookupResponse(AgentRecord):
+    """Lookup response body; the record may be bare or wrapped in ``agent``."""
+
+    agent: Optional[AgentRecord] = None
+
+
+class RegisterTool(msgspec.Struct, omit_defaults=True):
+    """A tool entry in a registration request (``inputSchema`` omitted if unset)."""
+
+    name: str
+    description: str
+    input_schema: Optional[dict[str, Any]] = msgspec.field(default=None, name="inputSchema")
+
+
+class RegisterRequest(msgspec.Struct):
+    """Request body for ``/dns/register``."""
+
+    name: str
+    endpoint: str
+    public_key: str = msgspec.field(name="publicKey")
+    tools: msgspec.Raw = msgspec.Raw(b"[]")
+    """Pre-encoded JSON array of RegisterTool."""
+
+
+class BatchLookupRequest(msgspec.Struct):
+    """Request body for ``/dns/lookup/batch``."""
+
+    names: list[str]
+
+
+class BatchLookupResponse(msgspec.Struct):
+    """Batch lookup response; names missing from ``agents`` were not found."""
+
+    agents: dict[str, AgentRecord] = {}
+
+
+_LOOKUP_JSON_DECODER = msgspec.json.Decoder(LookupResponse)
+_LOOKUP_MSGPACK_DECODER = msgspec.msgpack.Decoder(LookupResponse)
+_BATCH_JSON_DECODER = msgspec.json.Decoder(BatchLookupResponse)
+_BATCH_MSGPACK_DECODER = msgspec.msgpack.Decoder(BatchLookupResponse)
+_BATCH_ENCODER = msgspec.json.Encoder()
+
+# Servers that can answer in MessagePack should; JSON remains the fallback
+_LOOKUP_HEADERS = {"Accept": "application/msgpack, application/json;q=0.5"}
+REGISTER_ENCODER = msgspec.json.Encoder()
+
+
+def _decode(
+    resp: httpx.Response | RawResponse, json_decoder: Any, msgpack_decoder: Any
+) -> Any:
+    """Decode a response body according to its content type."""
+    try:
+        if resp.headers.get("content-type", "").startswith("application/msgpack"):
+            return msgpack_decoder.decode(resp.content)
+        return json_decoder.decode(resp.content)
+    except msgspec.DecodeError as e:
+        raise DNSError(DNSErrorCode.SERVER_ERROR, f"Invalid DNS response: {e}")
+
+
 # ============================================================================
 # Cache
 # ============================================================================
 
 
-@dataclass
+# Cache deadlines use the monotonic clock so wall-clock jumps (NTP, suspend)
+# can't extend or cut short a TTL; ResolvedAgent.resolved_at stays wall time.
+_monotonic = time.monotonic
+
+
+@dataclass(slots=True)
 class _CacheEntry:
     agent: ResolvedAgent
     expires_at: float
@@ -80,13 +204,43 @@ class _CacheEntry:
 # Resolver
 # ============================================================================
 
+# NOT_FOUND answers are cached briefly only, so new registrations show up fast
+MAX_NEGATIVE_TTL_SECONDS = 10.0
+
+# Expired entries checked at the cold end of the cache on each insert
+_SWEEP_BATCH = 8
+
+# How long resolve_many() waits for more names before sending a batch
+BATCH_WINDOW_SECONDS = 0.002
+
+
+def _waiter_error(e: BaseException) -> DNSError:
+    """A fresh DNSError for one waiter of a shared lookup or batch."""
+    if isinstance(e, DNSError):
+        error = DNSError(e.code, e.message)
+    else:
+        error = DNSError(DNSErrorCode.SERVER_ERROR, f"Unexpected error: {e}")
+    error.__cause__ = e
+    return error
+
+
+def _is_ip_literal(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
 
 @dataclass
 class DNSResolverConfig:
     server: str = "185.204.169.26"
     timeout_ms: int = 10_000
     default_ttl_seconds: int = 300
+    negative_ttl_seconds: float = 5.0
+    max_cache_entries: int = 10_000
     use_https: bool = False
+    raw_http: bool = False
     port: int = 3000
 
 
@@ -106,17 +260,78 @@ class DNSResolver:
         port: int = 3000,
         timeout_ms: int = 10_000,
         use_https: bool = False,
+        negative_ttl_seconds: float = 5.0,
+        max_cache_entries: int = 10_000,
+        raw_http: bool = False,
     ):
         self._config = DNSResolverConfig(
             server=server,
             port=port,
             timeout_ms=timeout_ms,
+            negative_ttl_seconds=min(negative_ttl_seconds, MAX_NEGATIVE_TTL_SECONDS),
+            max_cache_entries=max_cache_entries,
             use_https=use_https,
+            raw_http=raw_http,
         )
-        self._cache: dict[str, _CacheEntry] = {}
+        # Both caches are LRU-ordered, least recently used first
+        self._cache: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._negative_cache: OrderedDict[str, float] = OrderedDict()
+        server_is_ip = _is_ip_literal(server)
+        host = f"[{server}]" if server_is_ip and ":" in server else server
         self._base_url = (
-            f"{'https' if use_https else 'http'}://{server}:{port}"
+            f"{'https' if use_https else 'http'}://{host}:{port}"
         )
+        # A hostname server is resolved once and its address pinned for the
+        # client's lifetime. HTTPS keeps the hostname for certificate checks.
+        self._pin_server_address = not server_is_ip and not use_https
+        self._client: httpx.AsyncClient | None = None
+        # Optional lean HTTP/1.1 path for single lookups over plain HTTP;
+        # batches, HTTPS and anything it can't parse go through httpx.
+        self._raw: RawHTTPConnection | None = None
+        if raw_http and not use_https:
+            self._raw = RawHTTPConnection(server, port, timeout=timeout_ms / 1000)
+        self._inflight: dict[str, asyncio.Future[ResolvedAgent]] = {}
+        # Micro-batching state; None means batch support is not known yet
+        self._batch_supported: bool | None = None
+        self._batch_queue: dict[str, asyncio.Future[ResolvedAgent]] = {}
+        self._batch_handle: asyncio.TimerHandle | None = None
+        self._batch_tasks: set[asyncio.Task[None]] = set()
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            base_url, headers = self._base_url, None
+            if self._pin_server_address:
+                base_url, headers = await self._pinned_base_url()
+            # Another caller may have created the client while we resolved
+            if self._client is None:
+                self._client = httpx.AsyncClient(
+                    base_url=base_url,
+                    headers=headers,
+                    timeout=self._config.timeout_ms / 1000,
+                    limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60),
+                )
+        return self._client
+
+    async def _pinned_base_url(self) -> tuple[str, dict[str, str] | None]:
+        """
+        Resolve the DNS server hostname once, off the event loop.
+
+        Returns a base URL pointing at the resolved address plus the Host
+        header to send. If resolution fails, falls back to the hostname URL
+        and lets httpx resolve it per connection.
+        """
+        server, port = self._config.server, self._config.port
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                server, port, type=socket.SOCK_STREAM
+            )
+        except OSError:
+            return self._base_url, None
+        family, _, _, _, sockaddr = infos[0]
+        ip = sockaddr[0]
+        host = f"[{ip}]" if family == socket.AF_INET6 else ip
+        return f"http://{host}:{port}", {"Host": f"{server}:{port}"}
 
     async def resolve(self, name: str) -> ResolvedAgent:
         """
@@ -131,88 +346,293 @@ class DNSResolver:
         Raises:
             DNSError on failure
         """
-        # Handle both name and URI
+        return await self._resolve(name, batched=False)
+
+    async def resolve_many(self, names: Iterable[str]) -> list[ResolvedAgent]:
+        """
+        Resolve several agents, batching cache misses into one request.
+
+        Misses from all callers within a short window (BATCH_WINDOW_SECONDS)
+        are sent together to ``POST /dns/lookup/batch``. Servers without that
+        endpoint are detected on first use and served by single lookups.
+
+        Returns:
+            ResolvedAgent for each name, in order.
+
+        Raises:
+            DNSError if any name fails to resolve
+        """
+        return list(await asyncio.gather(*(self._resolve(n, batched=True) for n in names)))
+
+    async def _resolve(self, name: str, batched: bool) -> ResolvedAgent:
+        # Handle both name and URI; parse_agent_uri already validates the name
         if name.startswith("agent://"):
             parsed = parse_agent_uri(name)
             if parsed is None:
                 raise DNSError(DNSErrorCode.INVALID_NAME, f"Invalid URI: {name}")
             name = parsed
-
-        if not validate_agent_name(name):
+        elif not validate_agent_name(name):
             raise DNSError(DNSErrorCode.INVALID_NAME, f"Invalid agent name: {name}")
 
         # Check cache
         cached = self._cache.get(name)
-        if cached and cached.expires_at > time.time():
+        if cached and cached.expires_at > _monotonic():
+            self._cache.move_to_end(name)
             return cached.agent
 
-        # Resolve via HTTP
-        try:
-            async with httpx.AsyncClient(timeout=self._config.timeout_ms / 1000) as client:
-                resp = await client.get(f"{self._base_url}/dns/lookup/{name}")
-
-                if resp.status_code == 404:
-                    raise DNSError(DNSErrorCode.NOT_FOUND, f"Agent not found: {name}")
-
-                if resp.status_code != 200:
-                    raise DNSError(
-                        DNSErrorCode.SERVER_ERROR,
-                        f"DNS server error: {resp.status_code}",
-                    )
+        # Check negative cache
+        not_found_until = self._negative_cache.get(name)
+        if not_found_until is not None:
+            if not_found_until > _monotonic():
+                raise DNSError(DNSErrorCode.NOT_FOUND, f"Agent not found: {name}")
+            del self._negative_cache[name]
+
+        # Coalesce concurrent lookups of the same name into one request. The
+        # lookup runs as its own future so a cancelled caller doesn't cancel
+        # the other waiters.
+        pending = self._inflight.get(name)
+        if pending is None:
+            if batched and self._batch_supported is not False:
+                pending = self._enqueue_batch(name)
+            else:
+                pending = asyncio.ensure_future(self._lookup(name))
+            self._inflight[name] = pending
+            pending.add_done_callback(lambda fut: self._lookup_done(name, fut))
+
+        # Wait without raising the shared exception in every waiter (which
+        # would grow its traceback); each waiter raises its own copy instead.
+        # asyncio.wait() leaves the lookup running if this caller is cancelled.
+        if not pending.done():
+            await asyncio.wait((pending,))
+        error = pending.exception()
+        if error is not None:
+            raise _waiter_error(error)
+        return pending.result()
+
+    def _lookup_done(self, name: str, fut: asyncio.Future[ResolvedAgent]) -> None:
+        if self._inflight.get(name) is fut:
+            del self._inflight[name]
+        # Mark the outcome retrieved: every waiter may have been cancelled
+        if not fut.cancelled():
+            fut.exception()
+
+    async def _lookup(self, name: str) -> ResolvedAgent:
+        """Fetch a validated name from the DNS server and cache the result."""
+        url = f"/dns/lookup/{name}"
+        resp: httpx.Response | RawResponse | None = None
+        if self._raw is not None:
+            resp = await self._send_raw(url, f"for {name}")
+        if resp is None:
+            resp = await self._send("GET", url, f"for {name}", headers=_LOOKUP_HEADERS)
+
+        if resp.status_code == 404:
+            self._cache_not_found(name)
+            raise DNSError(DNSErrorCode.NOT_FOUND, f"Agent not found: {name}")
+
+        if resp.status_code != 200:
+            raise DNSError(
+                DNSErrorCode.SERVER_ERROR,
+                f"DNS server error: {resp.status_code}",
+            )
 
-                data = resp.json()
+        data = _decode(resp, _LOOKUP_JSON_DECODER, _LOOKUP_MSGPACK_DECODER)
+        return self._cache_record(name, data.agent if data.agent is not None else data)
 
+    async def _send(
+        self, method: str, url: str, target: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request to the DNS server, mapping transport errors to DNSError."""
+        try:
+            client = await self._get_client()
+            return await client.request(method, url, **kwargs)
         except httpx.TimeoutException:
-            raise DNSError(DNSErrorCode.TIMEOUT, f"DNS lookup timed out for {name}")
+            raise DNSError(DNSErrorCode.TIMEOUT, f"DNS lookup timed out {target}")
         except httpx.ConnectError as e:
             raise DNSError(DNSErrorCode.NETWORK_ERROR, f"Cannot reach DNS server: {e}")
-        except DNSError:
-            raise
         except Exception as e:
             raise DNSError(DNSErrorCode.SERVER_ERROR, f"Unexpected error: {e}")
 
-        # Parse response
-        agent_data = data.get("agent", data)
-        tools_raw = agent_data.get("tools", [])
-        tools = [
-            AgentTool(
-                name=t.get("name", ""),
-                description=t.get("description", ""),
-                input_schema=t.get("inputSchema") or t.get("input_schema"),
-                output_schema=t.get("outputSchema") or t.get("output_schema"),
-            )
-            for t in tools_raw
-        ]
+    async def _send_raw(self, url: str, target: str) -> RawResponse | None:
+        """GET over the raw HTTP/1.1 connection; None means retry with httpx."""
+        raw = self._raw
+        assert raw is not None
+        try:
+            return await raw.get(url, _LOOKUP_HEADERS)
+        except HTTPProtocolError:
+            # The server answers in a way this client can't read; stop trying
+            # the raw path so later lookups go straight to httpx
+            if self._raw is raw:
+                self._raw = None
+            await raw.aclose()
+            return None
+        except asyncio.TimeoutError:
+            raise DNSError(DNSErrorCode.TIMEOUT, f"DNS lookup timed out {target}")
+        except (OSError, EOFError) as e:
+            raise DNSError(DNSErrorCode.NETWORK_ERROR, f"Cannot reach DNS server: {e}")
 
+    def _cache_record(self, name: str, record: AgentRecord) -> ResolvedAgent:
+        """Build a ResolvedAgent from a DNS record and cache it."""
         agent = ResolvedAgent(
             name=name,
-            endpoint=agent_data.get("endpoint", ""),
-            public_key=agent_data.get("publicKey", agent_data.get("public_key", "")),
-            tools=tools,
-            capabilities=agent_data.get("capabilities", []),
-            ttl=agent_data.get("ttl", self._config.default_ttl_seconds),
-            metadata={
-                k: v
-                for k, v in agent_data.items()
-                if k not in ("name", "endpoint", "publicKey", "public_key", "tools", "capabilities", "ttl")
-            },
+            endpoint=record.endpoint,
+            public_key=record.public_key,
+            tools=[
+                AgentTool(
+                    name=t.name,
+                    description=t.description or "",
+                    input_schema=t.input_schema,
+                    output_schema=t.output_schema,
+                )
+                for t in record.tools or ()
+            ],
+            capabilities=record.capabilities or [],
+            ttl=record.ttl if record.ttl is not None else self._config.default_ttl_seconds,
+            metadata=record.metadata or {},
         )
 
-        # Cache
+        now = _monotonic()
+        self._make_room(self._cache, name, now, lambda e: e.expires_at)
         self._cache[name] = _CacheEntry(
             agent=agent,
-            expires_at=time.time() + agent.ttl,
+            expires_at=now + agent.ttl,
         )
 
         return agent
 
+    def _cache_not_found(self, name: str) -> None:
+        if self._config.negative_ttl_seconds > 0:
+            now = _monotonic()
+            self._make_room(self._negative_cache, name, now, lambda t: t)
+            self._negative_cache[name] = now + self._config.negative_ttl_seconds
+
+    # ------------------------------------------------------------------------
+    # Batching
+    # ------------------------------------------------------------------------
+
+    def _enqueue_batch(self, name: str) -> asyncio.Future[ResolvedAgent]:
+        """Queue a name for the next batch, opening a batch window if needed."""
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future[ResolvedAgent] = loop.create_future()
+        self._batch_queue[name] = fut
+        if self._batch_handle is None:
+            self._batch_handle = loop.call_later(BATCH_WINDOW_SECONDS, self._start_flush)
+        return fut
+
+    def _start_flush(self) -> None:
+        self._batch_handle = None
+        batch, self._batch_queue = self._batch_queue, {}
+        task = asyncio.ensure_future(self._flush_batch(batch))
+        # Hold a reference until done so the task isn't garbage collected
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _flush_batch(self, batch: dict[str, asyncio.Future[ResolvedAgent]]) -> None:
+        names = list(batch)
+        results: list[ResolvedAgent | BaseException]
+        try:
+            looked_up = await self._lookup_batch(names)
+        except Exception as e:
+            if self._batch_supported:
+                # Each waiter raises its own instance so tracebacks don't pile up
+                results = [_waiter_error(e) for _ in names]
+            else:
+                # The batch endpoint never worked here; don't fail the names for it
+                results = await self._lookup_each(names)
+        else:
+            if looked_up is None:
+                # No batch endpoint on this server; resolve one by one from now on
+                self._batch_supported = False
+                results = await self._lookup_each(names)
+            else:
+                results = looked_up
+
+        for fut, result in zip(batch.values(), results):
+            if fut.done():
+                continue
+            if isinstance(result, BaseException):
+                fut.set_exception(result)
+                # Mark retrieved: waiters may all have been cancelled
+                fut.exception()
+            else:
+                fut.set_result(result)
+
+    async def _lookup_each(self, names: list[str]) -> list[ResolvedAgent | BaseException]:
+        return await asyncio.gather(*(self._lookup(n) for n in names), return_exceptions=True)
+
+    async def _lookup_batch(
+        self, names: list[str]
+    ) -> list[ResolvedAgent | DNSError] | None:
+        """
+        Fetch several validated names in one request and cache the results.
+
+        Returns None if the server does not support batch lookups.
+        """
+        resp = await self._send(
+            "POST",
+            "/dns/lookup/batch",
+            f"for {len(names)} names",
+            content=_BATCH_ENCODER.encode(BatchLookupRequest(names=names)),
+            headers={**_LOOKUP_HEADERS, "Content-Type": "application/json"},
+        )
+
+        if resp.status_code in (404, 405, 501):
+            return None
+
+        if resp.status_code != 200:
+            raise DNSError(
+                DNSErrorCode.SERVER_ERROR,
+                f"DNS server error: {resp.status_code}",
+            )
+
+        data = _decode(resp, _BATCH_JSON_DECODER, _BATCH_MSGPACK_DECODER)
+        self._batch_supported = True
+
+        results: list[ResolvedAgent | DNSError] = []
+        for name in names:
+            record = data.agents.get(name)
+            if record is None:
+                self._cache_not_found(name)
+                results.append(DNSError(DNSErrorCode.NOT_FOUND, f"Agent not found: {name}"))
+            else:
+                results.append(self._cache_record(name, record))
+        return results
+
+    def _make_room(
+        self,
+        cache: OrderedDict[str, Any],
+        name: str,
+        now: float,
+        expires_at: Callable[[Any], float],
+    ) -> None:
+        """
+        Prepare an LRU cache for inserting ``name`` as its most recent entry.
+
+        Drops any stale entry for ``name`` and expired entries among the least
+        recently used few, then evicts the oldest entries while still full.
+        """
+        cache.pop(name, None)
+        for key in list(itertools.islice(cache, _SWEEP_BATCH)):
+            if expires_at(cache[key]) <= now:
+                del cache[key]
+        while cache and len(cache) >= self._config.max_cache_entries:
+            cache.popitem(last=False)
+
     async def resolve_uri(self, uri: str) -> ResolvedAgent:
         """Resolve a full agent:// URI."""
         return await self.resolve(uri)
 
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._raw is not None:
+            await self._raw.aclose()
+
     def clear_cache(self) -> None:
-        """Clear the DNS cache."""
+        """Clear the DNS cache, including cached NOT_FOUND answers."""
         self._cache.clear()
+        self._negative_cache.clear()
 
     def cache_size(self) -> int:
         """Number of entries in cache."""
@@ -2,11 +2,17 @@
 
 from .types import (
     MessageType,
+    FrameType,
     RequestFrame,
     ResponseFrame,
     EventFrame,
     ErrorFrame,
     ErrorCodes,
+    AnyFrame,
+    encode_frame,
+    encode_framed,
+    decode_frame,
+    decode_payload,
     create_request_frame,
     create_response_frame,
     create_event_frame,
@@ -16,11 +22,17 @@ from .types import (
 
 __all__ = [
     "MessageType",
+    "FrameType",
     "RequestFrame",
     "ResponseFrame",
     "EventFrame",
     "ErrorFrame",
     "ErrorCodes",
+    "AnyFrame",
+    "encode_frame",
+    "encode_framed",
+    "decode_frame",
+    "decode_payload",
     "create_request_frame",
     "create_response_frame",
     "create_event_frame",
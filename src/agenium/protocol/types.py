@@ -6,22 +6,34 @@ Frame types for agent-to-agent messaging.
 
 from __future__ import annotations
 
+import struct
+import sys
 import time
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import Any, Optional
+from collections.abc import Mapping
+from enum import IntEnum
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
+
+import msgspec
 
 from ..core.types import generate_id
 
 
-class MessageType(str, Enum):
-    REQUEST = "request"
-    RESPONSE = "response"
-    EVENT = "event"
-    ERROR = "error"
+FrameType = Literal["request", "response", "event", "error"]
+
+
+class MessageType:
+    """Wire values of the frame ``type`` tag (plain interned strings)."""
+
+    REQUEST: ClassVar[FrameType] = sys.intern("request")
+    RESPONSE: ClassVar[FrameType] = sys.intern("response")
+    EVENT: ClassVar[FrameType] = sys.intern("event")
+    ERROR: ClassVar[FrameType] = sys.intern("error")
 
 
-class ErrorCodes:
+class ErrorCodes(IntEnum):
+    # ErrorFrame.code stays a plain int on the wire so peers can send
+    # application-defined codes; members compare equal to their values.
     INVALID_REQUEST = -32600
     METHOD_NOT_FOUND = -32601
     INVALID_PARAMS = -32602
@@ -31,66 +43,152 @@ class ErrorCodes:
     DUPLICATE_MESSAGE = -32002
 
 
-@dataclass
-class RequestFrame:
+# Frames are msgspec Structs forming a union tagged by the "type" key on the
+# wire. ``id`` and ``timestamp_ns`` are filled in by the create_*_frame helpers;
+# a decoded frame keeps whatever the peer sent (validate_frame rejects a
+# missing id).
+#
+# Payload fields (``params``, ``result``, ``data``) hold plain Python values
+# in frames built locally. In a decoded frame they are msgspec.Raw: the peer's
+# encoded bytes, so routing code can forward a frame without materializing its
+# payload, and handlers decode it with decode_payload(), optionally straight
+# into a typed Struct. A payload the peer omitted keeps the Python default.
+# msgspec reads the runtime alias below to decode into Raw; type checkers
+# see Any, since either form may be present.
+if TYPE_CHECKING:
+    Payload = Any
+else:
+    Payload = msgspec.Raw
+
+# Shared, read-only params of requests built without any
+_EMPTY_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+
+class RequestFrame(msgspec.Struct, tag=MessageType.REQUEST, tag_field="type"):
     """A request expecting a response."""
 
-    type: MessageType = MessageType.REQUEST
-    id: str = field(default_factory=generate_id)
+    type: ClassVar[FrameType] = MessageType.REQUEST
+    id: str = ""
     method: str = ""
-    params: dict[str, Any] = field(default_factory=dict)
+    params: Payload = {}
     session_id: Optional[str] = None
-    timestamp: float = field(default_factory=time.time)
+    timestamp_ns: int = 0
 
 
-@dataclass
-class ResponseFrame:
+class ResponseFrame(msgspec.Struct, tag=MessageType.RESPONSE, tag_field="type"):
     """Response to a request."""
 
-    type: MessageType = MessageType.RESPONSE
-    id: str = field(default_factory=generate_id)
+    type: ClassVar[FrameType] = MessageType.RESPONSE
+    id: str = ""
     request_id: str = ""
-    result: Any = None
+    result: Payload = None
     session_id: Optional[str] = None
-    timestamp: float = field(default_factory=time.time)
+    timestamp_ns: int = 0
 
 
-@dataclass
-class EventFrame:
+class EventFrame(msgspec.Struct, tag=MessageType.EVENT, tag_field="type"):
     """One-way event (no response expected)."""
 
-    type: MessageType = MessageType.EVENT
-    id: str = field(default_factory=generate_id)
+    type: ClassVar[FrameType] = MessageType.EVENT
+    id: str = ""
     event: str = ""
-    data: Any = None
+    data: Payload = None
     session_id: Optional[str] = None
-    timestamp: float = field(default_factory=time.time)
+    timestamp_ns: int = 0
 
 
-@dataclass
-class ErrorFrame:
+class ErrorFrame(msgspec.Struct, tag=MessageType.ERROR, tag_field="type"):
     """Error response."""
 
-    type: MessageType = MessageType.ERROR
-    id: str = field(default_factory=generate_id)
+    type: ClassVar[FrameType] = MessageType.ERROR
+    id: str = ""
     request_id: str = ""
     code: int = ErrorCodes.INTERNAL_ERROR
     message: str = ""
-    data: Any = None
+    data: Payload = None
     session_id: Optional[str] = None
-    timestamp: float = field(default_factory=time.time)
+    timestamp_ns: int = 0
+
+
+AnyFrame = Union[RequestFrame, ResponseFrame, EventFrame, ErrorFrame]
+
+# Wall-clock nanoseconds as an int: no float boxing, compact msgpack integer
+_now_ns = time.time_ns
+
+
+def _enc_hook(obj: Any) -> Any:
+    # msgspec only encodes dict natively; other mappings (the shared empty
+    # params proxy, ChainMap, ...) are written as plain maps
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Cannot encode objects of type {type(obj).__name__}")
+
+
+_ENCODER = msgspec.msgpack.Encoder(enc_hook=_enc_hook)
+_DECODER = msgspec.msgpack.Decoder(AnyFrame)
+
+# Stream framing: each frame is preceded by its length as a 4-byte big-endian int
+_LENGTH_PREFIX = struct.Struct(">I")
+
+
+def encode_frame(frame: AnyFrame) -> bytes:
+    """Serialize a frame to MessagePack."""
+    return _ENCODER.encode(frame)
+
+
+def encode_framed(frame: AnyFrame, buf: bytearray) -> int:
+    """
+    Serialize a length-prefixed frame into a reusable buffer.
 
+    ``buf`` is overwritten and resized to hold exactly the prefix and the
+    frame; keep one per connection so sends don't allocate new bytes.
+    Returns the number of bytes to send.
+    """
+    _ENCODER.encode_into(frame, buf, _LENGTH_PREFIX.size)
+    _LENGTH_PREFIX.pack_into(buf, 0, len(buf) - _LENGTH_PREFIX.size)
+    return len(buf)
 
-AnyFrame = RequestFrame | ResponseFrame | EventFrame | ErrorFrame
+
+def decode_frame(data: bytes) -> AnyFrame:
+    """
+    Deserialize a MessagePack frame, dispatching on its ``type`` tag.
+
+    Raises:
+        msgspec.DecodeError if the data is not a valid frame
+    """
+    return _DECODER.decode(data)
+
+
+def decode_payload(value: Any, type: Any = Any) -> Any:
+    """
+    Decode a frame payload field (``params``, ``result`` or ``data``).
+
+    Raw bytes from a decoded frame are decoded as ``type``; values already
+    in Python form (locally built frames) are converted to ``type``.
+
+    Raises:
+        msgspec.ValidationError if the payload doesn't match ``type``
+    """
+    if isinstance(value, msgspec.Raw):
+        return msgspec.msgpack.decode(value, type=type)
+    if type is Any:
+        return value
+    return msgspec.convert(value, type)
 
 
 def create_request_frame(
     method: str,
-    params: dict[str, Any] | None = None,
+    params: Mapping[str, Any] | None = None,
     session_id: str | None = None,
 ) -> RequestFrame:
     """Create a new request frame."""
-    return RequestFrame(method=method, params=params or {}, session_id=session_id)
+    return RequestFrame(
+        id=generate_id(),
+        method=method,
+        params=_EMPTY_PARAMS if params is None else params,
+        session_id=session_id,
+        timestamp_ns=_now_ns(),
+    )
 
 
 def create_response_frame(
@@ -99,7 +197,13 @@ def create_response_frame(
     session_id: str | None = None,
 ) -> ResponseFrame:
     """Create a response frame for a request."""
-    return ResponseFrame(request_id=request_id, result=result, session_id=session_id)
+    return ResponseFrame(
+        id=generate_id(),
+        request_id=request_id,
+        result=result,
+        session_id=session_id,
+        timestamp_ns=_now_ns(),
+    )
 
 
 def create_event_frame(
@@ -108,7 +212,13 @@ def create_event_frame(
     session_id: str | None = None,
 ) -> EventFrame:
     """Create a new event frame."""
-    return EventFrame(event=event, data=data, session_id=session_id)
+    return EventFrame(
+        id=generate_id(),
+        event=event,
+        data=data,
+        session_id=session_id,
+        timestamp_ns=_now_ns(),
+    )
 
 
 def create_error_frame(
@@ -120,22 +230,28 @@ def create_error_frame(
 ) -> ErrorFrame:
     """Create an error response frame."""
     return ErrorFrame(
-        request_id=request_id, code=code, message=message, data=data, session_id=session_id
+        id=generate_id(),
+        request_id=request_id,
+        code=code,
+        message=message,
+        data=data,
+        session_id=session_id,
+        timestamp_ns=_now_ns(),
     )
 
 
+# Field each frame kind must carry besides ``id``, keyed on the exact class
+_REQUIRED_FIELD: dict[type, str] = {
+    RequestFrame: "method",
+    ResponseFrame: "request_id",
+    EventFrame: "event",
+    ErrorFrame: "request_id",
+}
+
+
 def validate_frame(frame: AnyFrame) -> bool:
     """Validate a frame has required fields."""
-    if not isinstance(frame, (RequestFrame, ResponseFrame, EventFrame, ErrorFrame)):
-        return False
-    if not frame.id:
-        return False
-    if isinstance(frame, RequestFrame) and not frame.method:
-        return False
-    if isinstance(frame, ResponseFrame) and not frame.request_id:
-        return False
-    if isinstance(frame, EventFrame) and not frame.event:
-        return False
-    if isinstance(frame, ErrorFrame) and not frame.request_id:
+    required = _REQUIRED_FIELD.get(type(frame))
+    if required is None:
         return False
-    return True
+    return bool(frame.id) and bool(getattr(frame, required))
@@ -6,14 +6,18 @@ Register, list, and invoke tools on an agent.
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Any, Awaitable, Callable, Optional
+from inspect import Parameter, isawaitable, iscoroutinefunction, signature
+from typing import Any, Awaitable, Callable, Optional, Union
 
 
-ToolHandler = Callable[..., Awaitable[Any]]
+# Either an async function or a plain function; plain ones are called directly
+ToolHandler = Callable[..., Union[Awaitable[Any], Any]]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolDefinition:
     """Definition of a tool that an agent can expose."""
 
@@ -23,7 +27,7 @@ class ToolDefinition:
     output_schema: Optional[dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolContext:
     """Context passed to tool handlers."""
 
@@ -32,7 +36,7 @@ class ToolContext:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolInvokeResult:
     """Result of invoking a tool."""
 
@@ -41,11 +45,27 @@ class ToolInvokeResult:
     error: Optional[str] = None
 
 
+# Bound on each registry's cache of "not found" results (names come from peers)
+_NOT_FOUND_RESULTS_MAX = 256
+
+
 class ToolRegistry:
     """Registry for agent tools."""
 
     def __init__(self) -> None:
-        self._tools: dict[str, tuple[ToolDefinition, ToolHandler]] = {}
+        # Definitions (for listing) and dispatch records live in separate
+        # dicts with the same keys
+        self._defs: dict[str, ToolDefinition] = {}
+        self._tools: dict[str, _Tool] = {}
+        # Recently probed missing names, so repeat misses don't allocate
+        self._not_found: OrderedDict[str, ToolInvokeResult] = OrderedDict()
+        self._version = 0
+        self._definitions: tuple[ToolDefinition, ...] | None = None
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the set of tools changes."""
+        return self._version
 
     def register(
         self,
@@ -62,20 +82,34 @@ class ToolRegistry:
             input_schema=input_schema,
             output_schema=output_schema,
         )
-        self._tools[name] = (defn, handler)
+        self._defs[name] = defn
+        self._tools[name] = _Tool.of(handler)
+        self._not_found.pop(name, None)
+        self._version += 1
+        self._definitions = None
         return defn
 
     def unregister(self, name: str) -> bool:
         """Unregister a tool. Returns True if it existed."""
-        return self._tools.pop(name, None) is not None
+        if self._defs.pop(name, None) is None:
+            return False
+        del self._tools[name]
+        self._version += 1
+        self._definitions = None
+        return True
 
     def get(self, name: str) -> tuple[ToolDefinition, ToolHandler] | None:
         """Get a tool definition and handler by name."""
-        return self._tools.get(name)
+        defn = self._defs.get(name)
+        if defn is None:
+            return None
+        return defn, self._tools[name].handler
 
-    def list_tools(self) -> list[ToolDefinition]:
-        """List all registered tools."""
-        return [defn for defn, _ in self._tools.values()]
+    def list_tools(self) -> tuple[ToolDefinition, ...]:
+        """List all registered tools (cached until the registry changes)."""
+        if self._definitions is None:
+            self._definitions = tuple(self._defs.values())
+        return self._definitions
 
     async def invoke(
         self, name: str, params: dict[str, Any], context: ToolContext
@@ -83,23 +117,127 @@ class ToolRegistry:
         """
         Invoke a tool by name.
 
-        Returns ToolInvokeResult with success/result or error.
+        Returns ToolInvokeResult with success/result or error. Results for
+        unknown tools are shared between calls on this registry and must
+        not be modified.
         """
-        entry = self._tools.get(name)
-        if entry is None:
-            return ToolInvokeResult(success=False, error=f"Tool not found: {name}")
-
-        _, handler = entry
+        tool = self._tools.get(name)
+        if tool is None:
+            return self._not_found_result(name)
+        # Decoded payloads can be any value; only mappings bind to parameters
+        if type(params) is not dict and not isinstance(params, Mapping):
+            return ToolInvokeResult(
+                success=False,
+                error=f"Invalid parameters: expected a mapping, not {type(params).__name__}",
+            )
+
+        # Params naming exactly the handler's positional parameters are passed
+        # positionally; anything else is checked against the signature and
+        # goes through the generic keyword call.
+        args = None
+        positional = tool.positional
+        if positional is not None and len(params) == len(positional):
+            try:
+                args = [params[n] for n in positional]
+            except KeyError:
+                pass
+        if args is None and tool.required is not None:
+            problem = tool.check(params)
+            if problem is not None:
+                return ToolInvokeResult(success=False, error=f"Invalid parameters: {problem}")
+
+        handler = tool.handler
         try:
-            result = await handler(**params)
+            result = handler(**params) if args is None else handler(*args)
+            # Plain handlers returning an awaitable (e.g. objects with an
+            # async __call__) aren't detected up front
+            if tool.is_async or isawaitable(result):
+                result = await result
             return ToolInvokeResult(success=True, result=result)
-        except TypeError as e:
-            return ToolInvokeResult(success=False, error=f"Invalid parameters: {e}")
         except Exception as e:
             return ToolInvokeResult(success=False, error=f"Tool error: {e}")
 
+    def _not_found_result(self, name: str) -> ToolInvokeResult:
+        cache = self._not_found
+        result = cache.get(name)
+        if result is not None:
+            cache.move_to_end(name)
+            return result
+        result = ToolInvokeResult(success=False, error=f"Tool not found: {name}")
+        cache[name] = result
+        if len(cache) > _NOT_FOUND_RESULTS_MAX:
+            cache.popitem(last=False)
+        return result
+
     def __len__(self) -> int:
-        return len(self._tools)
+        return len(self._defs)
 
     def __contains__(self, name: str) -> bool:
-        return name in self._tools
+        return name in self._defs
+
+
+@dataclass(slots=True)
+class _Tool:
+    """A tool handler plus facts about it worked out once at registration."""
+
+    handler: ToolHandler
+
+    is_async: bool
+    """Whether the handler is a coroutine function."""
+
+    positional: tuple[str, ...] | None = None
+    """Names to pass positionally when params match them exactly, if safe."""
+
+    required: frozenset[str] | None = None
+    """Names that must be present in params (None if the signature is unknown)."""
+
+    accepted: frozenset[str] | None = None
+    """Names params may contain (None if the handler takes **kwargs)."""
+
+    @classmethod
+    def of(cls, handler: ToolHandler) -> _Tool:
+        is_async = iscoroutinefunction(handler)
+        try:
+            # The handler's own signature: a functools.wraps wrapper taking
+            # **kwargs must not be bound as if it were the wrapped function
+            params = tuple(signature(handler, follow_wrapped=False).parameters.values())
+        except (TypeError, ValueError):
+            return cls(handler=handler, is_async=is_async)
+
+        kinds = {p.kind for p in params}
+        keyword = [
+            p for p in params if p.kind in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY)
+        ]
+        # Required positional-only parameters can never be given by keyword,
+        # so they count as missing.
+        required = frozenset(
+            p.name
+            for p in params
+            if p.default is Parameter.empty
+            and p.kind not in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+        )
+        positional = None
+        if Parameter.POSITIONAL_ONLY not in kinds and not any(
+            p.kind is Parameter.KEYWORD_ONLY and p.name in required for p in params
+        ):
+            positional = tuple(p.name for p in params if p.kind is Parameter.POSITIONAL_OR_KEYWORD)
+        accepted = None if Parameter.VAR_KEYWORD in kinds else frozenset(p.name for p in keyword)
+        return cls(
+            handler=handler,
+            is_async=is_async,
+            positional=positional,
+            required=required,
+            accepted=accepted,
+        )
+
+    def check(self, params: dict[str, Any]) -> str | None:
+        """Describe why params can't bind to the handler, or None if they can."""
+        assert self.required is not None
+        missing = self.required - params.keys()
+        if missing:
+            return "missing " + ", ".join(map(repr, sorted(missing)))
+        if self.accepted is not None:
+            unexpected = params.keys() - self.accepted
+            if unexpected:
+                return "unexpected " + ", ".join(map(repr, sorted(unexpected)))
+        return None
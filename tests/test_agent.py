@@ -1,5 +1,10 @@
 """Tests for the Agent class."""
 
+import json
+import subprocess
+import sys
+
+import httpx
 import pytest
 
 from agenium.agent import Agent, AgentConfig
@@ -97,3 +102,96 @@ class TestAgentCrypto:
         a1 = Agent("agent-one")
         a2 = Agent("agent-two")
         assert a1.keys.public_key_b64 != a2.keys.public_key_b64
+
+
+class TestAgentRegister:
+    @pytest.mark.asyncio
+    async def test_register_payload(self):
+        bodies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/dns/register"
+            assert request.headers["Authorization"] == "Bearer dom_test"
+            bodies.append(json.loads(request.content))
+            return httpx.Response(201, json={"ok": True})
+
+        agent = Agent("test-agent")
+        agent._dns_client = httpx.AsyncClient(
+            base_url="http://dns.test", transport=httpx.MockTransport(handler)
+        )
+
+        @agent.tool("greet", description="Greet", input_schema={"type": "object"})
+        async def greet(name: str) -> str:
+            return name
+
+        result = await agent.register(api_key="dom_test", host="https://h:8443")
+        assert result.success
+        assert result.domain == "agent://test-agent"
+        assert result.tools == 1
+        assert bodies[0] == {
+            "name": "test-agent",
+            "endpoint": "https://h:8443",
+            "publicKey": agent.keys.public_key_b64,
+            "tools": [{"name": "greet", "description": "Greet", "inputSchema": {"type": "object"}}],
+        }
+
+        cached = agent._encoded_tools()
+        await agent.register(api_key="dom_test")
+        assert agent._encoded_tools() is cached
+
+        @agent.tool("other")
+        async def other() -> str:
+            return "x"
+
+        result = await agent.register(api_key="dom_test")
+        assert result.tools == 2
+        assert [t["name"] for t in bodies[-1]["tools"]] == ["greet", "other"]
+        assert bodies[-1]["tools"][1] == {"name": "other", "description": ""}
+        await agent.stop()
+
+
+class TestLazyImport:
+    def test_import_is_light(self):
+        code = (
+            "import sys, agenium; "
+            "agenium.parse_agent_uri('agent://alice'); "
+            "print('httpx' in sys.modules, 'cryptography' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.split() == ["False", "False"]
+
+    def test_lazy_names_resolve(self):
+        import agenium
+        from agenium.agent import Agent as AgentClass
+        from agenium.dns import DNSResolver
+
+        assert agenium.Agent is AgentClass
+        assert agenium.DNSResolver is DNSResolver
+        assert "Agent" in dir(agenium)
+        with pytest.raises(AttributeError):
+            agenium.does_not_exist
+
+
+class TestAgentSessions:
+    @pytest.mark.asyncio
+    async def test_sessions_view(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, json={"name": "peer", "endpoint": "https://peer:8443", "publicKey": "pk"}
+            )
+
+        agent = Agent("test-agent")
+        agent._resolver._client = httpx.AsyncClient(
+            base_url="http://dns.test", transport=httpx.MockTransport(handler)
+        )
+        sessions = agent.sessions
+        assert len(sessions) == 0
+
+        result = await agent.connect("agent://peer")
+        assert result.success
+        assert sessions[result.session.id] is result.session
+        with pytest.raises(TypeError):
+            sessions["other"] = result.session  # type: ignore[index]
+        await agent.stop()
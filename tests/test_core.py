@@ -1,9 +1,14 @@
 """Tests for core types and utilities."""
 
+import dataclasses
+
+import pytest
+
 from agenium.core.types import (
     AgentID,
     Session,
     SessionState,
+    _normalize_agent_name,
     generate_id,
     is_valid_agent_uri,
     parse_agent_uri,
@@ -37,6 +42,26 @@ class TestParseAgentURI:
     def test_case_insensitive(self):
         assert parse_agent_uri("agent://MyAgent") == "myagent"
 
+    def test_invalid_characters(self):
+        assert parse_agent_uri("agent://bad_name") is None
+        assert parse_agent_uri("agent://bad.name") is None
+
+    def test_idn(self):
+        assert parse_agent_uri("agent://Café-Bot") == "café-bot"
+
+    def test_cached(self):
+        parse_agent_uri("agent://cached-agent")
+        hits = _normalize_agent_name.cache_info().hits
+        assert parse_agent_uri("agent://cached-agent") == "cached-agent"
+        assert validate_agent_name("cached-agent") is True
+        assert _normalize_agent_name.cache_info().hits == hits + 2
+
+    def test_long_input_not_cached(self):
+        size = _normalize_agent_name.cache_info().currsize
+        assert parse_agent_uri("agent://" + "a" * 10_000) is None
+        assert validate_agent_name("b" * 10_000) is False
+        assert _normalize_agent_name.cache_info().currsize == size
+
 
 class TestValidateAgentName:
     def test_valid(self):
@@ -50,6 +75,18 @@ class TestValidateAgentName:
         assert validate_agent_name("") is False
         assert validate_agent_name("a" * 51) is False
 
+    def test_invalid_characters(self):
+        assert validate_agent_name("bad_name") is False
+        assert validate_agent_name("has space") is False
+        assert validate_agent_name("bad-") is False
+
+    def test_mixed_case_and_idn(self):
+        assert validate_agent_name("MyAgent") is True
+        assert validate_agent_name("café-bot") is True
+
+    def test_idn_trailing_newline(self):
+        assert validate_agent_name("café\n") is False
+
 
 class TestToAgentURI:
     def test_basic(self):
@@ -74,12 +111,25 @@ class TestGenerateID:
 
     def test_format(self):
         id_ = generate_id()
-        assert len(id_) == 36  # UUID format
+        assert len(id_) == 32  # 128-bit hex
+        int(id_, 16)
+
+
+class TestAgentID:
+    def test_hashable(self):
+        a = AgentID(name="test", public_key="abc")
+        b = AgentID(name="test", public_key="abc")
+        assert {a: 1}[b] == 1
+
+    def test_frozen(self):
+        agent = AgentID(name="test", public_key="abc")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            agent.name = "other"  # type: ignore[misc]
 
 
 class TestSession:
     def test_create(self):
         agent = AgentID(name="test", public_key="abc")
         session = Session(id="s1", local_agent=agent, remote_agent=agent)
-        assert session.state == SessionState.INITIATING
+        assert session.state is SessionState.INITIATING
         assert session.id == "s1"
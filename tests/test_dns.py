@@ -0,0 +1,599 @@
+"""Tests for DNS resolver."""
+
+import asyncio
+import json
+
+import httpx
+import msgspec
+import pytest
+
+from agenium.dns.resolver import DNSError, DNSErrorCode, DNSResolver
+
+
+def make_resolver(handler) -> DNSResolver:
+    resolver = DNSResolver(server="dns.test", port=3000)
+    resolver._client = httpx.AsyncClient(
+        base_url="http://dns.test:3000", transport=httpx.MockTransport(handler)
+    )
+    return resolver
+
+
+def agent_record(name: str, **extra) -> dict:
+    return {
+        "name": name,
+        "endpoint": f"https://{name}.example:8443",
+        "publicKey": "pk-" + name,
+        "tools": [{"name": "greet", "description": "Greet", "inputSchema": {"type": "object"}}],
+        "capabilities": ["tools"],
+        "ttl": 60,
+        **extra,
+    }
+
+
+class TestResolve:
+    @pytest.mark.asyncio
+    async def test_resolve_wrapped(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/dns/lookup/alice"
+            return httpx.Response(200, json={"agent": agent_record("alice")})
+
+        resolver = make_resolver(handler)
+        agent = await resolver.resolve("agent://alice")
+        assert agent.name == "alice"
+        assert agent.uri == "agent://alice"
+        assert agent.endpoint == "https://alice.example:8443"
+        assert agent.public_key == "pk-alice"
+        assert agent.tools[0].name == "greet"
+        assert agent.tools[0].input_schema == {"type": "object"}
+        assert agent.capabilities == ["tools"]
+        assert agent.ttl == 60
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_resolve_bare_record_default_ttl(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            record = agent_record("bob")
+            del record["ttl"]
+            return httpx.Response(200, content=json.dumps(record))
+
+        resolver = make_resolver(handler)
+        agent = await resolver.resolve("bob")
+        assert agent.public_key == "pk-bob"
+        assert agent.ttl == 300
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_resolve_msgpack(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.headers["Accept"].startswith("application/msgpack")
+            return httpx.Response(
+                200,
+                content=msgspec.msgpack.encode({"agent": agent_record("alice")}),
+                headers={"Content-Type": "application/msgpack"},
+            )
+
+        resolver = make_resolver(handler)
+        agent = await resolver.resolve("alice")
+        assert agent.public_key == "pk-alice"
+        assert agent.tools[0].input_schema == {"type": "object"}
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_snake_case_keys(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            record = {
+                "endpoint": "https://alice.example",
+                "public_key": "snake",
+                "tools": [{"name": "greet", "input_schema": {"a": 1}, "output_schema": {"b": 2}}],
+            }
+            return httpx.Response(200, json=record)
+
+        resolver = make_resolver(handler)
+        agent = await resolver.resolve("alice")
+        assert agent.public_key == "snake"
+        assert agent.tools[0].input_schema == {"a": 1}
+        assert agent.tools[0].output_schema == {"b": 2}
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_camel_case_key_preferred(self):
+        resolver = make_resolver(
+            lambda request: httpx.Response(200, json=agent_record("alice", public_key="snake"))
+        )
+        assert (await resolver.resolve("alice")).public_key == "pk-alice"
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_null_tools(self):
+        resolver = make_resolver(
+            lambda request: httpx.Response(200, json=agent_record("alice", tools=None))
+        )
+        assert (await resolver.resolve("alice")).tools == []
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_null_description(self):
+        record = agent_record("alice")
+        record["tools"][0]["description"] = None
+        resolver = make_resolver(lambda request: httpx.Response(200, json=record))
+        assert (await resolver.resolve("alice")).tools[0].description == ""
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_float_and_null_ttl(self):
+        records = {"alice": agent_record("alice", ttl=60.0), "bob": agent_record("bob", ttl=None)}
+        resolver = make_resolver(
+            lambda request: httpx.Response(200, json=records[request.url.path.rsplit("/", 1)[1]])
+        )
+        assert (await resolver.resolve("alice")).ttl == 60.0
+        assert (await resolver.resolve("bob")).ttl == 300
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cached(self):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(200, json=agent_record("alice"))
+
+        resolver = make_resolver(handler)
+        first = await resolver.resolve("alice")
+        second = await resolver.resolve("agent://alice")
+        assert first is second
+        assert len(calls) == 1
+        assert resolver.cache_size() == 1
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_not_found(self):
+        resolver = make_resolver(lambda request: httpx.Response(404))
+        with pytest.raises(DNSError) as exc:
+            await resolver.resolve("missing")
+        assert exc.value.code == DNSErrorCode.NOT_FOUND
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_server_error(self):
+        resolver = make_resolver(lambda request: httpx.Response(500))
+        with pytest.raises(DNSError) as exc:
+            await resolver.resolve("alice")
+        assert exc.value.code == DNSErrorCode.SERVER_ERROR
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_invalid_name(self):
+        resolver = make_resolver(lambda request: httpx.Response(200))
+        with pytest.raises(DNSError) as exc:
+            await resolver.resolve("agent://-bad")
+        assert exc.value.code == DNSErrorCode.INVALID_NAME
+        await resolver.aclose()
+
+
+class TestClient:
+    @pytest.mark.asyncio
+    async def test_client_reused(self):
+        resolver = DNSResolver(server="dns.test")
+        client = await resolver._get_client()
+        assert await resolver._get_client() is client
+        await resolver.aclose()
+        assert client.is_closed
+        assert resolver._client is None
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_coalesced(self):
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=agent_record("alice"))
+
+        resolver = make_resolver(handler)
+        results = await asyncio.gather(*(resolver.resolve("alice") for _ in range(10)))
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+        assert not resolver._inflight
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_errors_shared(self):
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(404)
+
+        resolver = make_resolver(handler)
+        results = await asyncio.gather(
+            *(resolver.resolve("missing") for _ in range(5)), return_exceptions=True
+        )
+        assert len(calls) == 1
+        assert all(isinstance(r, DNSError) for r in results)
+        assert all(r.code == DNSErrorCode.NOT_FOUND for r in results)
+        # Each waiter raises its own instance
+        assert len({id(r) for r in results}) == len(results)
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_failure_after_all_waiters_cancelled(self):
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await release.wait()
+            return httpx.Response(500)
+
+        resolver = make_resolver(handler)
+        waiter = asyncio.ensure_future(resolver.resolve("alice"))
+        while "alice" not in resolver._inflight:
+            await asyncio.sleep(0)
+        lookup = resolver._inflight["alice"]
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        release.set()
+        await asyncio.wait((lookup,))
+        await asyncio.sleep(0)
+        # The done-callback retrieved the exception, so asyncio won't log it
+        assert lookup._log_traceback is False
+        assert isinstance(lookup.exception(), DNSError)
+        assert not resolver._inflight
+        await resolver.aclose()
+
+
+class TestNegativeCache:
+    @pytest.mark.asyncio
+    async def test_not_found_cached(self):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(404)
+
+        resolver = make_resolver(handler)
+        for _ in range(3):
+            with pytest.raises(DNSError) as exc:
+                await resolver.resolve("missing")
+            assert exc.value.code == DNSErrorCode.NOT_FOUND
+        assert len(calls) == 1
+
+        resolver.clear_cache()
+        with pytest.raises(DNSError):
+            await resolver.resolve("missing")
+        assert len(calls) == 2
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(404)
+
+        resolver = make_resolver(handler)
+        resolver._config.negative_ttl_seconds = 0
+        for _ in range(2):
+            with pytest.raises(DNSError):
+                await resolver.resolve("missing")
+        assert len(calls) == 2
+        await resolver.aclose()
+
+    def test_ttl_capped(self):
+        resolver = DNSResolver(negative_ttl_seconds=3600)
+        assert resolver._config.negative_ttl_seconds == 10.0
+
+
+class TestCacheBound:
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            name = request.url.path.rsplit("/", 1)[-1]
+            calls.append(name)
+            return httpx.Response(200, json=agent_record(name))
+
+        resolver = make_resolver(handler)
+        resolver._config.max_cache_entries = 2
+        await resolver.resolve("alice")
+        await resolver.resolve("bob")
+        await resolver.resolve("alice")  # hit, alice becomes most recent
+        await resolver.resolve("carol")  # evicts bob
+        assert resolver.cache_size() == 2
+        assert list(resolver._cache) == ["alice", "carol"]
+
+        await resolver.resolve("alice")
+        assert calls == ["alice", "bob", "carol"]
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_swept(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            name = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json=agent_record(name, ttl=0))
+
+        resolver = make_resolver(handler)
+        for name in ("alice", "bob", "carol"):
+            await resolver.resolve(name)
+        # Zero-TTL entries are swept as soon as something else is inserted
+        assert list(resolver._cache) == ["carol"]
+        await resolver.aclose()
+
+
+class TestServerAddress:
+    def test_ip_server_not_pinned(self):
+        resolver = DNSResolver(server="10.0.0.1", port=3000)
+        assert resolver._base_url == "http://10.0.0.1:3000"
+        assert not resolver._pin_server_address
+
+    def test_ipv6_server_bracketed(self):
+        resolver = DNSResolver(server="::1", port=3000)
+        assert resolver._base_url == "http://[::1]:3000"
+
+    @pytest.mark.asyncio
+    async def test_hostname_pinned_once(self):
+        resolver = DNSResolver(server="localhost", port=3000)
+        assert resolver._pin_server_address
+        client = await resolver._get_client()
+        assert client.base_url.host in ("127.0.0.1", "::1")
+        assert client.headers["Host"] == "localhost:3000"
+        await resolver.aclose()
+
+    def test_https_keeps_hostname(self):
+        resolver = DNSResolver(server="dns.example", use_https=True)
+        assert not resolver._pin_server_address
+
+
+class TestResolveMany:
+    @pytest.mark.asyncio
+    async def test_batched(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append((request.method, request.url.path))
+            names = json.loads(request.content)["names"]
+            return httpx.Response(
+                200, json={"agents": {n: agent_record(n) for n in names if n != "missing"}}
+            )
+
+        resolver = make_resolver(handler)
+        first, second = await asyncio.gather(
+            resolver.resolve_many(["alice", "agent://bob"]),
+            resolver.resolve_many(["carol", "alice"]),
+        )
+        assert [a.name for a in first] == ["alice", "bob"]
+        assert [a.name for a in second] == ["carol", "alice"]
+        assert requests == [("POST", "/dns/lookup/batch")]
+        assert resolver.cache_size() == 3
+
+        with pytest.raises(DNSError) as exc:
+            await resolver.resolve_many(["alice", "missing"])
+        assert exc.value.code == DNSErrorCode.NOT_FOUND
+        assert len(requests) == 2
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_fallback_without_batch_endpoint(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append((request.method, request.url.path))
+            if request.method == "POST":
+                return httpx.Response(404)
+            name = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json=agent_record(name))
+
+        resolver = make_resolver(handler)
+        agents = await resolver.resolve_many(["alice", "bob"])
+        assert [a.name for a in agents] == ["alice", "bob"]
+        assert resolver._batch_supported is False
+
+        await resolver.resolve_many(["carol"])
+        assert requests == [
+            ("POST", "/dns/lookup/batch"),
+            ("GET", "/dns/lookup/alice"),
+            ("GET", "/dns/lookup/bob"),
+            ("GET", "/dns/lookup/carol"),
+        ]
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_unconfirmed_batch_failure_falls_back(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.method)
+            if request.method == "POST":
+                return httpx.Response(500)
+            return httpx.Response(200, json=agent_record(request.url.path.rsplit("/", 1)[-1]))
+
+        resolver = make_resolver(handler)
+        agents = await resolver.resolve_many(["alice", "bob"])
+        assert [a.name for a in agents] == ["alice", "bob"]
+        assert requests == ["POST", "GET", "GET"]
+        # A server error doesn't prove the endpoint missing; try it again later
+        assert resolver._batch_supported is None
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_batch_rate_limited_not_disabled(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.method)
+            if request.method == "POST":
+                return httpx.Response(429)
+            return httpx.Response(200, json=agent_record(request.url.path.rsplit("/", 1)[-1]))
+
+        resolver = make_resolver(handler)
+        agents = await resolver.resolve_many(["alice"])
+        assert agents[0].name == "alice"
+        # A transient client error must not switch batching off for good
+        assert resolver._batch_supported is None
+        await resolver.resolve_many(["bob"])
+        assert requests == ["POST", "GET", "POST", "GET"]
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_confirmed_batch_failure_errors_per_name(self):
+        status = [200]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            names = json.loads(request.content)["names"]
+            if status[0] != 200:
+                return httpx.Response(status[0])
+            return httpx.Response(200, json={"agents": {n: agent_record(n) for n in names}})
+
+        resolver = make_resolver(handler)
+        await resolver.resolve_many(["alice"])
+        status[0] = 500
+        results = await asyncio.gather(
+            resolver.resolve_many(["bob"]),
+            resolver.resolve_many(["carol"]),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, DNSError) for r in results)
+        assert results[0] is not results[1]
+        assert results[0].code == DNSErrorCode.SERVER_ERROR
+        await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_shares_batch_with_resolve(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.method)
+            names = json.loads(request.content)["names"]
+            return httpx.Response(200, json={"agents": {n: agent_record(n) for n in names}})
+
+        resolver = make_resolver(handler)
+        many = asyncio.ensure_future(resolver.resolve_many(["alice"]))
+        while "alice" not in resolver._inflight:
+            await asyncio.sleep(0)
+        single = await resolver.resolve("alice")
+        assert (await many)[0] is single
+        assert requests == ["POST"]
+        await resolver.aclose()
+
+
+class RawDNSServer:
+    """Tiny HTTP/1.1 server answering lookups with canned framing."""
+
+    def __init__(self, framing: str = "length", close_after: int = 0):
+        self.framing = framing
+        self.close_after = close_after
+        self.connections = 0
+        self.paths: list[str] = []
+
+    async def __aenter__(self) -> "RawDNSServer":
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer) -> None:
+        self.connections += 1
+        served = 0
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                path = head.split(b" ")[1].decode()
+                self.paths.append(path)
+                body = json.dumps(agent_record(path.rsplit("/", 1)[-1])).encode()
+                if self.framing == "chunked":
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                        b"Transfer-Encoding: chunked\r\n\r\n"
+                        + b"%x\r\n%s\r\n0\r\n\r\n" % (len(body), body)
+                    )
+                elif self.framing == "early-hints":
+                    writer.write(
+                        b"HTTP/1.1 103 Early Hints\r\nLink: </style.css>; rel=preload\r\n\r\n"
+                        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                        b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+                    )
+                elif self.framing == "eof":
+                    writer.write(b"HTTP/1.1 200 OK\r\n\r\n" + body)
+                    await writer.drain()
+                    break
+                else:
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                        b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+                    )
+                await writer.drain()
+                served += 1
+                if served == self.close_after:
+                    break
+        except asyncio.IncompleteReadError:
+            pass
+        writer.close()
+
+
+class TestRawHTTP:
+    @pytest.mark.asyncio
+    async def test_keep_alive(self):
+        async with RawDNSServer() as server:
+            resolver = DNSResolver(server="127.0.0.1", port=server.port, raw_http=True)
+            alice = await resolver.resolve("alice")
+            bob = await resolver.resolve("bob")
+            assert (alice.name, bob.name) == ("alice", "bob")
+            assert alice.public_key == "pk-alice"
+            assert server.connections == 1
+            assert resolver._client is None
+            await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_chunked(self):
+        async with RawDNSServer(framing="chunked") as server:
+            resolver = DNSResolver(server="127.0.0.1", port=server.port, raw_http=True)
+            agent = await resolver.resolve("alice")
+            assert agent.tools[0].name == "greet"
+            await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_server_close(self):
+        async with RawDNSServer(close_after=1) as server:
+            resolver = DNSResolver(server="127.0.0.1", port=server.port, raw_http=True)
+            await resolver.resolve("alice")
+            await asyncio.sleep(0.01)
+            await resolver.resolve("bob")
+            assert server.connections == 2
+            await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_skips_interim_responses(self):
+        async with RawDNSServer(framing="early-hints") as server:
+            resolver = DNSResolver(server="127.0.0.1", port=server.port, raw_http=True)
+            alice = await resolver.resolve("alice")
+            bob = await resolver.resolve("bob")
+            assert (alice.public_key, bob.public_key) == ("pk-alice", "pk-bob")
+            assert bob.endpoint == "https://bob.example:8443"
+            assert server.connections == 1
+            await resolver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_httpx(self):
+        async with RawDNSServer(framing="eof") as server:
+            resolver = DNSResolver(server="127.0.0.1", port=server.port, raw_http=True)
+            agent = await resolver.resolve("alice")
+            assert agent.name == "alice"
+            assert server.paths == ["/dns/lookup/alice", "/dns/lookup/alice"]
+            assert resolver._client is not None
+            # The raw path is abandoned, so the next lookup sends one request
+            await resolver.resolve("bob")
+            assert server.paths[2:] == ["/dns/lookup/bob"]
+            assert resolver._raw is None
+            await resolver.aclose()
+
+    def test_https_never_raw(self):
+        resolver = DNSResolver(server="dns.example", use_https=True, raw_http=True)
+        assert resolver._raw is None
@@ -1,5 +1,10 @@
 """Tests for protocol types."""
 
+import collections
+
+import msgspec
+import pytest
+
 from agenium.protocol.types import (
     ErrorCodes,
     ErrorFrame,
@@ -11,6 +16,10 @@ from agenium.protocol.types import (
     create_event_frame,
     create_request_frame,
     create_response_frame,
+    decode_frame,
+    decode_payload,
+    encode_frame,
+    encode_framed,
     validate_frame,
 )
 
@@ -18,10 +27,16 @@ from agenium.protocol.types import (
 class TestFrameCreation:
     def test_request(self):
         frame = create_request_frame("tool.invoke", {"tool": "greet"})
-        assert frame.type == MessageType.REQUEST
+        assert frame.type == MessageType.REQUEST == "request"
+        assert type(frame.type) is str
         assert frame.method == "tool.invoke"
         assert frame.params == {"tool": "greet"}
         assert frame.id
+        assert isinstance(frame.timestamp_ns, int)
+        assert frame.timestamp_ns > 0
+
+    def test_unique_ids(self):
+        assert create_event_frame("a").id != create_event_frame("a").id
 
     def test_response(self):
         frame = create_response_frame("req-1", result={"ok": True})
@@ -63,5 +78,94 @@ class TestValidateFrame:
         frame = create_event_frame("test")
         assert validate_frame(frame) is True
 
+    def test_invalid_error_no_request_id(self):
+        frame = create_error_frame("", -32603, "boom")
+        assert validate_frame(frame) is False
+
     def test_invalid_not_a_frame(self):
         assert validate_frame("not a frame") is False  # type: ignore
+
+
+class TestFrameCodec:
+    def test_roundtrip(self):
+        frames = [
+            create_request_frame("tool.invoke", {"tool": "greet"}, session_id="s1"),
+            create_response_frame("req-1", result=[1, 2]),
+            create_event_frame("ping", data={"ts": 123}),
+            create_error_frame("req-1", ErrorCodes.TIMEOUT, "slow"),
+        ]
+        for frame in frames:
+            decoded = decode_frame(encode_frame(frame))
+            assert type(decoded) is type(frame)
+            assert encode_frame(decoded) == encode_frame(frame)
+
+    def test_payload_stays_raw(self):
+        frame = create_request_frame("tool.invoke", {"tool": "greet", "input": {"n": 1}})
+        decoded = decode_frame(encode_frame(frame))
+        assert isinstance(decoded.params, msgspec.Raw)
+        assert decode_payload(decoded.params) == {"tool": "greet", "input": {"n": 1}}
+
+    def test_constructor_defaults(self):
+        assert RequestFrame().params == {}
+        assert ResponseFrame().result is None
+        assert EventFrame().data is None
+
+    def test_payload_defaults(self):
+        decoded = decode_frame(msgspec.msgpack.encode({"type": "request", "id": "x"}))
+        assert decode_payload(decoded.params) == {}
+        decoded = decode_frame(msgspec.msgpack.encode({"type": "event", "id": "x"}))
+        assert decode_payload(decoded.data) is None
+
+    def test_no_params_shared(self):
+        a = create_request_frame("ping")
+        b = create_request_frame("ping")
+        assert a.params is b.params
+        assert a.params == {}
+        with pytest.raises(TypeError):
+            a.params["x"] = 1  # type: ignore[index]
+        assert msgspec.msgpack.decode(encode_frame(a))["params"] == {}
+
+    def test_params_any_mapping(self):
+        frame = create_request_frame("x", collections.ChainMap({"a": 1}, {"b": 2}))
+        assert msgspec.msgpack.decode(encode_frame(frame))["params"] == {"a": 1, "b": 2}
+
+    def test_unencodable_payload(self):
+        with pytest.raises(TypeError):
+            encode_frame(create_event_frame("x", data=object()))
+
+    def test_payload_typed(self):
+        class Greet(msgspec.Struct):
+            tool: str
+
+        frame = create_request_frame("tool.invoke", {"tool": "greet"})
+        decoded = decode_frame(encode_frame(frame))
+        assert decode_payload(decoded.params, Greet) == Greet(tool="greet")
+        assert decode_payload(frame.params, Greet) == Greet(tool="greet")
+        with pytest.raises(msgspec.ValidationError):
+            decode_payload(decoded.params, list[int])
+
+    def test_type_tag_on_wire(self):
+        data = msgspec.msgpack.decode(encode_frame(create_event_frame("ping")))
+        assert data["type"] == "event"
+
+    def test_error_codes(self):
+        decoded = decode_frame(encode_frame(create_error_frame("r", ErrorCodes.TIMEOUT)))
+        assert ErrorCodes(decoded.code) is ErrorCodes.TIMEOUT
+        # Application-defined codes pass through untouched
+        assert decode_frame(encode_frame(create_error_frame("r", 4001))).code == 4001
+
+    def test_tags_match_message_type(self):
+        for cls in (RequestFrame, ResponseFrame, EventFrame, ErrorFrame):
+            assert cls.__struct_config__.tag == cls.type
+
+    def test_framed_reuses_buffer(self):
+        buf = bytearray(64 * 1024)
+        for frame in (create_event_frame("ping", data={"n": 1}), create_request_frame("x")):
+            n = encode_framed(frame, buf)
+            assert n == len(buf)
+            assert int.from_bytes(buf[:4], "big") == n - 4
+            assert bytes(buf[4:n]) == encode_frame(frame)
+
+    def test_unknown_type_rejected(self):
+        with pytest.raises(msgspec.DecodeError):
+            decode_frame(msgspec.msgpack.encode({"type": "bogus", "id": "x"}))
@@ -1,10 +1,11 @@
 """Tests for tool registry."""
 
 import asyncio
+import functools
 
 import pytest
 
-from agenium.tools.registry import ToolContext, ToolRegistry
+from agenium.tools.registry import _NOT_FOUND_RESULTS_MAX, ToolContext, ToolRegistry
 
 
 @pytest.fixture
@@ -45,6 +46,30 @@ class TestToolRegistry:
         names = {t.name for t in tools}
         assert names == {"a", "b"}
 
+    def test_list_tools_cached(self, registry: ToolRegistry):
+        async def handler() -> str:
+            return "ok"
+
+        registry.register("a", handler)
+        tools = registry.list_tools()
+        assert registry.list_tools() is tools
+        registry.register("b", handler)
+        assert len(registry.list_tools()) == 2
+        registry.unregister("a")
+        assert [t.name for t in registry.list_tools()] == ["b"]
+
+    def test_version(self, registry: ToolRegistry):
+        async def handler() -> str:
+            return "ok"
+
+        v0 = registry.version
+        registry.register("a", handler)
+        assert registry.version == v0 + 1
+        assert registry.unregister("missing") is False
+        assert registry.version == v0 + 1
+        registry.unregister("a")
+        assert registry.version == v0 + 2
+
     def test_contains(self, registry: ToolRegistry):
         async def handler() -> str:
             return "ok"
@@ -71,6 +96,17 @@ class TestToolRegistry:
         assert result.success is False
         assert "not found" in result.error.lower()
 
+    @pytest.mark.asyncio
+    async def test_invoke_not_found_shared(self, registry: ToolRegistry):
+        ctx = ToolContext(session_id="s1", agent_name="test")
+        first = await registry.invoke("missing", {}, ctx)
+        assert await registry.invoke("missing", {}, ctx) is first
+        assert await ToolRegistry().invoke("missing", {}, ctx) is not first
+        for i in range(_NOT_FOUND_RESULTS_MAX + 1):
+            await registry.invoke(f"probe-{i}", {}, ctx)
+        assert len(registry._not_found) == _NOT_FOUND_RESULTS_MAX
+        assert "missing" not in registry._not_found
+
     @pytest.mark.asyncio
     async def test_invoke_error(self, registry: ToolRegistry):
         async def fail() -> None:
@@ -81,3 +117,98 @@ class TestToolRegistry:
         result = await registry.invoke("fail", {}, ctx)
         assert result.success is False
         assert "boom" in result.error
+
+    @pytest.mark.asyncio
+    async def test_invoke_sync(self, registry: ToolRegistry):
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        registry.register("add", add)
+        ctx = ToolContext(session_id="s1", agent_name="test")
+        result = await registry.invoke("add", {"a": 2, "b": 3}, ctx)
+        assert result.success is True
+        assert result.result == 5
+
+    @pytest.mark.asyncio
+    async def test_invoke_async_callable(self, registry: ToolRegistry):
+        class Echo:
+            async def __call__(self, text: str) -> str:
+                return text
+
+        registry.register("echo", Echo())
+        ctx = ToolContext(session_id="s1", agent_name="test")
+        result = await registry.invoke("echo", {"text": "hi"}, ctx)
+        assert result.result == "hi"
+
+    @pytest.mark.asyncio
+    async def test_invoke_keyword_fallback(self, registry: ToolRegistry):
+        async def greet(name: str, greeting: str = "Hello", *, punct: str = "!") -> str:
+            return f"{greeting}, {name}{punct}"
+
+        registry.register("greet", greet)
+        ctx = ToolContext(session_id="s1", agent_name="test")
+        result = await registry.invoke("greet", {"greeting": "Hi", "name": "Bob"}, ctx)
+        assert result.result == "Hi, Bob!"
+        result = await registry.invoke("greet", {"name": "Bob", "punct": "?"}, ctx)
+        assert result.result == "Hello, Bob?"
+        result = await registry.invoke("greet", {"name": "Bob", "extra": 1}, ctx)
+        assert result.success is False
+
+    @pytest.mark.asyncio
+    async def test_invoke_invalid_params(self, registry: ToolRegistry):
+        async def add(a: int, b: int = 0) -> int:
+            return a + b
+
+        registry.register("add", add)
+        ctx = ToolContext(session_id="s1", agent_name="test")
+        result = await registry.invoke("add", {"b": 1}, ctx)
+        assert result.success is False
+        assert result.error == "Invalid parameters: missing 'a'"
+        result = await registry.invoke("add", {"a": 1, "c": 2}, ctx)
+        assert result.error == "Invalid parameters: unexpected 'c'"
+
+    @pytest.mark.asyncio
+    async def test_invoke_handler_type_error(self, registry: ToolRegistry):
+        async def bad(a: int) -> int:
+            return a + "x"  # type: ignore[operator]
+
+        registry.register("bad", bad)
+        ctx = ToolContext(session_id="s1", agent_name="test")
+        result = await registry.invoke("bad", {"a": 1}, ctx)
+        assert result.error.startswith("Tool error:")
+
+    @pytest.mark.asyncio
+    async def test_invoke_wrapped_handler(self, registry: ToolRegistry):
+        def logged(fn):
+            @functools.wraps(fn)
+            async def wrapper(**kwargs):
+                kwargs.pop("trace", None)
+                return await fn(**kwargs)
+
+            return wrapper
+
+        @logged
+        async def add(a: int, b: int) -> int:
+            return a + b
+
+        registry.register("add", add)
+        ctx = ToolContext(session_id="s1", agent_name="test")
+        assert (await registry.invoke("add", {"a": 1, "b": 2}, ctx)).result == 3
+        assert (await registry.invoke("add", {"a": 1, "b": 2, "trace": "x"}, ctx)).result == 3
+
+    @pytest.mark.asyncio
+    async def test_invoke_params_not_mapping(self, registry: ToolRegistry):
+        async def add(a: int, b: int) -> int:
+            return a + b
+
+        async def kw(*, a: int) -> int:
+            return a
+
+        registry.register("add", add)
+        registry.register("kw", kw)
+        ctx = ToolContext(session_id="s1", agent_name="test")
+        for tool in ("add", "kw"):
+            for params in (None, [1, 2], "ab"):
+                result = await registry.invoke(tool, params, ctx)  # type: ignore[arg-type]
+                assert result.success is False
+                assert result.error.startswith("Invalid parameters: expected a mapping")